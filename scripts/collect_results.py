@@ -13,59 +13,54 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
 import math
+import os
 import re
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from statistics import median
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
 
 
 def warn(msg: str) -> None:
     print(f"[WARN] {msg}", file=sys.stderr)
 
 
+_NAN = float("nan")
+
+
 def safe_float(x: Any) -> float:
+    # The exact type check keeps the common already-float case free of any
+    # exception setup; float() itself tolerates surrounding whitespace.
+    # Ints convert inside the try too: float(10**400) raises OverflowError.
+    if type(x) is float:
+        return x
+    if x is None or x == "":
+        return _NAN
     try:
-        if x is None:
-            return float("nan")
-        if isinstance(x, (int, float)):
-            return float(x)
-        s = str(x).strip()
-        if s == "":
-            return float("nan")
-        return float(s)
-    except Exception:
-        return float("nan")
+        return float(x)
+    except (ValueError, TypeError, OverflowError):
+        return _NAN
 
 
 def safe_int(x: Any, default: int = 0) -> int:
+    if type(x) is int:
+        return x
+    if x is None or x == "":
+        return default
     try:
-        if x is None:
-            return default
-        if isinstance(x, int):
-            return x
-        s = str(x).strip()
-        if s == "":
-            return default
-        return int(float(s))
-    except Exception:
+        # int(float("inf")) raises OverflowError; these helpers never raise.
+        return int(float(x))
+    except (ValueError, TypeError, OverflowError):
         return default
 
 
-def median_ignore_nan(values: Iterable[Any]) -> float:
-    nums: List[float] = []
-    for v in values:
-        f = safe_float(v)
-        if not math.isnan(f):
-            nums.append(f)
-    return median(nums) if nums else float("nan")
-
-
 def parse_cpu_percent(s: str) -> float:
     try:
         s = (s or "").strip()
@@ -78,45 +73,46 @@ def parse_cpu_percent(s: str) -> float:
 
 _MEM_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([A-Za-z]+)\s*$")
 
+# Unit -> MiB multiplier (binary units plus docker's decimal KB/MB/GB).
+_UNIT_MIB: Dict[str, float] = {
+    "B": 1.0 / (1024.0 * 1024.0),
+    "KiB": 1.0 / 1024.0,
+    "MiB": 1.0,
+    "GiB": 1024.0,
+    "TiB": 1024.0 * 1024.0,
+    "KB": 1000.0 / (1024.0 * 1024.0),
+    "MB": (1000.0 * 1000.0) / (1024.0 * 1024.0),
+    "GB": (1000.0 * 1000.0 * 1000.0) / (1024.0 * 1024.0),
+}
 
-def mem_to_mib(mem_used_part: str) -> float:
-    try:
-        s = (mem_used_part or "").strip()
-        m = _MEM_RE.match(s)
-        if not m:
-            return float("nan")
-        val = float(m.group(1))
-        unit = m.group(2)
-
-        if unit == "B":
-            return val / (1024.0 * 1024.0)
-        if unit == "KiB":
-            return val / 1024.0
-        if unit == "MiB":
-            return val
-        if unit == "GiB":
-            return val * 1024.0
-        if unit == "TiB":
-            return val * 1024.0 * 1024.0
-
-        if unit == "KB":
-            return (val * 1000.0) / (1024.0 * 1024.0)
-        if unit == "MB":
-            return (val * 1000.0 * 1000.0) / (1024.0 * 1024.0)
-        if unit == "GB":
-            return (val * 1000.0 * 1000.0 * 1000.0) / (1024.0 * 1024.0)
 
+def mem_to_mib(mem_used_part: str) -> float:
+    m = _MEM_RE.match(mem_used_part or "")
+    if not m:
         return float("nan")
-    except Exception:
+    mult = _UNIT_MIB.get(m.group(2))
+    if mult is None:
         return float("nan")
+    return float(m.group(1)) * mult
+
+
+# Matches the used-memory half of docker's "512.3MiB / 7.6GiB" in one pass,
+# without splitting off and stripping an intermediate string first.
+_MEM_USAGE_LEFT_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([A-Za-z]+)\s*(?:/|$)")
 
 
 def parse_mem_usage_to_mib(mem_usage: str) -> float:
-    try:
-        left = (mem_usage or "").split("/", 1)[0].strip()
-        return mem_to_mib(left)
-    except Exception:
+    m = _MEM_USAGE_LEFT_RE.match(mem_usage or "")
+    if not m:
+        return float("nan")
+    mult = _UNIT_MIB.get(m.group(2))
+    if mult is None:
         return float("nan")
+    return float(m.group(1)) * mult
+
+
+_ISO_TZ_RE = re.compile(r"^(.*?)(\.\d+)?([+-]\d{2}:\d{2})$")
+_ISO_FRAC_RE = re.compile(r"(\d+)(.*)$")
 
 
 def parse_iso_dt(ts: str) -> datetime:
@@ -127,7 +123,15 @@ def parse_iso_dt(ts: str) -> datetime:
     if s.endswith("Z"):
         s = s[:-1] + "+00:00"
 
-    m = re.match(r"^(.*?)(\.\d+)?([+-]\d{2}:\d{2})$", s)
+    # Fast path: Python 3.11+ fromisoformat handles variable-digit fractions
+    # and offsets directly in C. Fall back to regex normalization only for
+    # inputs it rejects.
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+
+    m = _ISO_TZ_RE.match(s)
     if m:
         base, frac, tz = m.group(1), m.group(2), m.group(3)
         if frac:
@@ -140,7 +144,7 @@ def parse_iso_dt(ts: str) -> datetime:
 
     if "." in s:
         base, rest = s.split(".", 1)
-        digits_m = re.match(r"(\d+)(.*)$", rest)
+        digits_m = _ISO_FRAC_RE.match(rest)
         if digits_m:
             digits = digits_m.group(1)
             tail = digits_m.group(2)
@@ -149,7 +153,7 @@ def parse_iso_dt(ts: str) -> datetime:
     return datetime.fromisoformat(s)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BundleMeta:
     scenario: str
     h3_res: int
@@ -159,6 +163,14 @@ class BundleMeta:
     zipf_s_from_folder: float
 
 
+_BUNDLE_R = re.compile(r"-r(\d+)-")
+_BUNDLE_TTL = re.compile(r"-ttl([^-]+)-")
+_BUNDLE_HOT = re.compile(r"-hot([^-]+)-")
+_BUNDLE_INV = re.compile(r"-inv([^-]+)-")
+_BUNDLE_ZIPF = re.compile(r"-zipfs([0-9]+(?:\.[0-9]+)?)")
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_bundle_meta(bundle_name: str) -> BundleMeta:
     name = bundle_name.strip()
 
@@ -173,19 +185,19 @@ def parse_bundle_meta(bundle_name: str) -> BundleMeta:
         elif "cache" in name:
             scenario = "cache"
 
-    m_r = re.search(r"-r(\d+)-", name)
+    m_r = _BUNDLE_R.search(name)
     h3_res = int(m_r.group(1)) if m_r else 0
 
-    m_ttl = re.search(r"-ttl([^-]+)-", name)
+    m_ttl = _BUNDLE_TTL.search(name)
     ttl = m_ttl.group(1) if m_ttl else ""
 
-    m_hot = re.search(r"-hot([^-]+)-", name)
+    m_hot = _BUNDLE_HOT.search(name)
     hot = m_hot.group(1) if m_hot else ""
 
-    m_inv = re.search(r"-inv([^-]+)-", name)
+    m_inv = _BUNDLE_INV.search(name)
     invalidation = m_inv.group(1) if m_inv else ""
 
-    m_zipf = re.search(r"-zipfs([0-9]+(?:\.[0-9]+)?)", name)
+    m_zipf = _BUNDLE_ZIPF.search(name)
     zipf_s_from_folder = float(m_zipf.group(1)) if m_zipf else float("nan")
 
     return BundleMeta(
@@ -198,17 +210,23 @@ def parse_bundle_meta(bundle_name: str) -> BundleMeta:
     )
 
 
+_REP_RE = re.compile(r"^rep(\d+)$")
+
+
 def parse_rep_int(rep_dir_name: str) -> Optional[int]:
-    m = re.match(r"^rep(\d+)$", rep_dir_name)
+    m = _REP_RE.match(rep_dir_name)
     if not m:
         return None
     return int(m.group(1))
 
 
+_VALID_CONTAINERS = frozenset(("postgis", "geoserver"))
+
+
 def compute_docker_averages(
     docker_csv_path: Path,
-    start_iso: Optional[str],
-    end_iso: Optional[str],
+    start_dt: Optional[datetime],
+    end_dt: Optional[datetime],
 ) -> Dict[str, float]:
     out = {
         "postgis_cpu_avg_pct": float("nan"),
@@ -217,58 +235,119 @@ def compute_docker_averages(
         "geoserver_mem_avg_mib": float("nan"),
     }
 
-    start_dt: Optional[datetime] = None
-    end_dt: Optional[datetime] = None
-    if start_iso and end_iso:
-        try:
-            start_dt = parse_iso_dt(start_iso)
-            end_dt = parse_iso_dt(end_iso)
-        except Exception as e:
-            warn(f"{docker_csv_path}: failed to parse start/end timestamps; using all docker rows ({e})")
-            start_dt = None
-            end_dt = None
-
-    cpu_vals: Dict[str, List[float]] = {"postgis": [], "geoserver": []}
-    mem_vals: Dict[str, List[float]] = {"postgis": [], "geoserver": []}
+    # Running (sum, count) per container keeps memory O(containers) instead
+    # of buffering every sample just to average it afterwards.
+    cpu_sum = {"postgis": 0.0, "geoserver": 0.0}
+    cpu_n = {"postgis": 0, "geoserver": 0}
+    mem_sum = {"postgis": 0.0, "geoserver": 0.0}
+    mem_n = {"postgis": 0, "geoserver": 0}
+
+    # docker stats are sampled per container, so the same ts string repeats;
+    # cache parses so each unique timestamp is parsed once (None = bad ts).
+    ts_cache: Dict[str, Optional[datetime]] = {}
+
+    # capture-stats.sh writes fixed-width "%Y-%m-%dT%H:%M:%SZ" timestamps in
+    # time order. For rows in that canonical form the whole window check is
+    # a pair of string comparisons against pre-normalized bounds -- no
+    # timestamp parse at all. Rows in any other format fall back to
+    # parsed-datetime comparisons. Out-of-window rows are skipped rather
+    # than aborting the scan: the file is usually time-ordered, but an
+    # unordered file must not silently lose in-window samples.
+    start_key: Optional[str] = None
+    end_key: Optional[str] = None
+    if (start_dt is not None and end_dt is not None
+            and start_dt.tzinfo is not None and end_dt.tzinfo is not None):
+        key_dt = start_dt.astimezone(timezone.utc)
+        if key_dt.microsecond:
+            key_dt += timedelta(seconds=1)  # ceil: whole-second ts >= start
+        start_key = key_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        # floor: whole-second ts <= end
+        end_key = end_dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     try:
-        with docker_csv_path.open("r", newline="") as f:
-            reader = csv.DictReader(f)
+        with docker_csv_path.open("r", newline="", buffering=1024 * 1024, encoding="utf-8") as f:
+            # csv.reader avoids the per-row dict that DictReader builds;
+            # resolve column indices from the header once instead.
+            reader = csv.reader(f)
+            try:
+                header = next(reader)
+                i_ts = header.index("ts")
+                i_c = header.index("container")
+                i_cpu = header.index("cpu_perc")
+                i_mem = header.index("mem_usage")
+            except (StopIteration, ValueError) as e:
+                warn(f"{docker_csv_path}: missing/invalid docker_stats.csv header ({e})")
+                return out
+
             for row in reader:
                 try:
-                    ts_s = (row.get("ts") or "").strip()
-                    container = (row.get("container") or "").strip().lower()
-                    if container not in cpu_vals:
-                        continue
-
-                    try:
-                        ts_dt = parse_iso_dt(ts_s)
-                    except Exception:
-                        continue
-
-                    if start_dt is not None and end_dt is not None:
-                        if ts_dt < start_dt or ts_dt > end_dt:
+                    ts_s = row[i_ts].strip()
+
+                    if end_key is not None and len(ts_s) == 20 and ts_s.endswith("Z"):
+                        if ts_s < start_key or ts_s > end_key:
+                            continue
+                    else:
+                        if ts_s in ts_cache:
+                            ts_dt = ts_cache[ts_s]
+                        else:
+                            try:
+                                ts_dt = parse_iso_dt(ts_s)
+                            except Exception:
+                                ts_dt = None
+                            ts_cache[ts_s] = ts_dt
+                        if ts_dt is None:
+                            continue
+
+                        if start_dt is not None and end_dt is not None:
+                            if ts_dt < start_dt or ts_dt > end_dt:
+                                continue
+
+                    # Producers emit canonical lowercase names; only pay for
+                    # strip().lower() when the raw value doesn't match.
+                    container = row[i_c]
+                    if container not in _VALID_CONTAINERS:
+                        container = container.strip().lower()
+                        if container not in _VALID_CONTAINERS:
                             continue
 
-                    cpu_vals[container].append(parse_cpu_percent(row.get("cpu_perc", "")))
-                    mem_vals[container].append(parse_mem_usage_to_mib(row.get("mem_usage", "")))
+                    cpu = parse_cpu_percent(row[i_cpu])
+                    if not math.isnan(cpu):
+                        cpu_sum[container] += cpu
+                        cpu_n[container] += 1
+                    mem = parse_mem_usage_to_mib(row[i_mem])
+                    if not math.isnan(mem):
+                        mem_sum[container] += mem
+                        mem_n[container] += 1
                 except Exception:
                     continue
     except Exception as e:
         warn(f"{docker_csv_path}: failed to read docker_stats.csv ({e})")
         return out
 
-    def avg(xs: List[float]) -> float:
-        ys = [x for x in xs if not math.isnan(x)]
-        return sum(ys) / len(ys) if ys else float("nan")
-
-    out["postgis_cpu_avg_pct"] = avg(cpu_vals["postgis"])
-    out["geoserver_cpu_avg_pct"] = avg(cpu_vals["geoserver"])
-    out["postgis_mem_avg_mib"] = avg(mem_vals["postgis"])
-    out["geoserver_mem_avg_mib"] = avg(mem_vals["geoserver"])
+    if cpu_n["postgis"]:
+        out["postgis_cpu_avg_pct"] = cpu_sum["postgis"] / cpu_n["postgis"]
+    if cpu_n["geoserver"]:
+        out["geoserver_cpu_avg_pct"] = cpu_sum["geoserver"] / cpu_n["geoserver"]
+    if mem_n["postgis"]:
+        out["postgis_mem_avg_mib"] = mem_sum["postgis"] / mem_n["postgis"]
+    if mem_n["geoserver"]:
+        out["geoserver_mem_avg_mib"] = mem_sum["geoserver"] / mem_n["geoserver"]
     return out
 
 
+_SUMMARY_KEYS: Tuple[str, ...] = (
+    "start", "end", "duration_sec",
+    "total", "success", "errors",
+    "throughput_rps", "target_rps", "achieved_to_target_ratio",
+    "missed_tokens", "max_backlog", "token_buffer",
+    "p50_ms", "p95_ms", "p99_ms",
+    "concurrency",
+    "zipf_s", "zipf_v",
+    "bboxes",
+    "layer", "target",
+    "seed",
+)
+
 RUNS_LONG_COLUMNS: List[str] = [
     "root_id",
     "bundle_name",
@@ -328,17 +407,83 @@ RUNS_AGG_COLUMNS: List[str] = [
 ]
 
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
 def load_json(path: Path) -> Optional[Dict[str, Any]]:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _json_loads(path.read_bytes())
     except Exception as e:
         warn(f"{path}: failed to read/parse JSON ({e})")
         return None
 
 
-def collect_runs(roots: List[Path]) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
+# One rep's worth of work: (root_id, bundle_name, rep_num, meta, summary_path,
+# docker_path). Kept picklable so reps can be farmed out to worker processes.
+RepTask = Tuple[str, str, int, BundleMeta, Path, Path]
+
+
+def _process_rep(task: RepTask) -> Optional[Dict[str, Any]]:
+    root_id, bundle_name, rep_num, meta, summary_path, docker_path = task
+    scenario = meta.scenario
+
+    summary = load_json(summary_path)
+    if not summary:
+        warn(f"Empty/invalid summary JSON, skipping rep: {summary_path}")
+        return None
+
+    row: Dict[str, Any] = {
+        "root_id": root_id,
+        "bundle_name": bundle_name,
+        "rep": rep_num,
+        "scenario": scenario,
+        "h3_res": meta.h3_res,
+        "ttl": meta.ttl,
+        "hot": meta.hot,
+        "invalidation": meta.invalidation,
+        "zipf_s_from_folder": meta.zipf_s_from_folder,
+    }
+    row.update((k, summary[k]) for k in _SUMMARY_KEYS if k in summary)
+
+    if row.get("achieved_to_target_ratio", "") in ("", None):
+        thr = safe_float(row.get("throughput_rps"))
+        tgt = safe_float(row.get("target_rps"))
+        row["achieved_to_target_ratio"] = (thr / tgt) if (tgt and not math.isnan(tgt) and tgt != 0) else float("nan")
+
+    if row.get("zipf_s", "") in ("", None):
+        row["zipf_s"] = meta.zipf_s_from_folder
+
+    # Parse the rep window once here rather than handing ISO strings down.
+    start_dt: Optional[datetime] = None
+    end_dt: Optional[datetime] = None
+    start_iso = str(row.get("start") or "")
+    end_iso = str(row.get("end") or "")
+    if start_iso and end_iso:
+        try:
+            start_dt = parse_iso_dt(start_iso)
+            end_dt = parse_iso_dt(end_iso)
+        except Exception as e:
+            warn(f"{docker_path}: failed to parse start/end timestamps; using all docker rows ({e})")
+            start_dt = None
+            end_dt = None
+
+    docker_avgs = compute_docker_averages(
+        docker_csv_path=docker_path,
+        start_dt=start_dt,
+        end_dt=end_dt,
+    )
+    row.update(docker_avgs)
+
+    return row
+
+
+def collect_rep_tasks(roots: List[Path]) -> List[RepTask]:
+    tasks: List[RepTask] = []
 
     for root in roots:
         if not root.exists() or not root.is_dir():
@@ -347,143 +492,133 @@ def collect_runs(roots: List[Path]) -> List[Dict[str, Any]]:
 
         root_id = root.name
 
-        for bundle_dir in sorted(root.iterdir()):
-            if not bundle_dir.is_dir():
+        # os.scandir yields DirEntry objects whose is_dir() answers from the
+        # cached dirent, avoiding an extra stat per path vs. Path.iterdir().
+        with os.scandir(root) as it:
+            bundle_entries = sorted(it, key=lambda e: e.name)
+
+        for bundle_entry in bundle_entries:
+            if not bundle_entry.is_dir(follow_symlinks=False):
                 continue
 
-            bundle_name = bundle_dir.name
+            bundle_name = bundle_entry.name
             meta = parse_bundle_meta(bundle_name)
 
-            rep_dirs = [p for p in bundle_dir.iterdir() if p.is_dir()]
-            for rep_dir in sorted(rep_dirs):
-                rep_num = parse_rep_int(rep_dir.name)
+            with os.scandir(bundle_entry.path) as it:
+                rep_entries = sorted(it, key=lambda e: e.name)
+
+            for rep_entry in rep_entries:
+                if not rep_entry.is_dir(follow_symlinks=False):
+                    continue
+                rep_num = parse_rep_int(rep_entry.name)
                 if rep_num is None:
                     continue
 
-                scenario = meta.scenario
-                summary_path = rep_dir / f"{scenario}_summary.json"
-                docker_path = rep_dir / "docker_stats.csv"
+                summary_path = os.path.join(rep_entry.path, f"{meta.scenario}_summary.json")
+                docker_path = os.path.join(rep_entry.path, "docker_stats.csv")
 
-                if not summary_path.exists():
+                if not os.path.exists(summary_path):
                     warn(f"Missing summary JSON, skipping rep: {summary_path}")
                     continue
-                if not docker_path.exists():
+                if not os.path.exists(docker_path):
                     warn(f"Missing docker_stats.csv, skipping rep: {docker_path}")
                     continue
 
-                summary = load_json(summary_path)
-                if not summary:
-                    warn(f"Empty/invalid summary JSON, skipping rep: {summary_path}")
-                    continue
+                tasks.append((root_id, bundle_name, rep_num, meta, Path(summary_path), Path(docker_path)))
 
-                row: Dict[str, Any] = {c: "" for c in RUNS_LONG_COLUMNS}
-
-                row["root_id"] = root_id
-                row["bundle_name"] = bundle_name
-                row["rep"] = rep_num
-                row["scenario"] = scenario
-                row["h3_res"] = meta.h3_res
-                row["ttl"] = meta.ttl
-                row["hot"] = meta.hot
-                row["invalidation"] = meta.invalidation
-                row["zipf_s_from_folder"] = meta.zipf_s_from_folder
-
-                for k in [
-                    "start", "end", "duration_sec",
-                    "total", "success", "errors",
-                    "throughput_rps", "target_rps", "achieved_to_target_ratio",
-                    "missed_tokens", "max_backlog", "token_buffer",
-                    "p50_ms", "p95_ms", "p99_ms",
-                    "concurrency",
-                    "zipf_s", "zipf_v",
-                    "bboxes",
-                    "layer", "target",
-                    "seed",
-                ]:
-                    if k in summary:
-                        row[k] = summary.get(k)
-
-                if row.get("achieved_to_target_ratio", "") in ("", None):
-                    thr = safe_float(row.get("throughput_rps"))
-                    tgt = safe_float(row.get("target_rps"))
-                    row["achieved_to_target_ratio"] = (thr / tgt) if (tgt and not math.isnan(tgt) and tgt != 0) else float("nan")
-
-                if row.get("zipf_s", "") in ("", None):
-                    row["zipf_s"] = meta.zipf_s_from_folder
-
-                docker_avgs = compute_docker_averages(
-                    docker_csv_path=docker_path,
-                    start_iso=str(row.get("start") or "") or None,
-                    end_iso=str(row.get("end") or "") or None,
-                )
-                row.update(docker_avgs)
-
-                rows.append(row)
-
-    return rows
-
-
-def write_csv(path: Path, columns: List[str], rows: List[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
-        w.writeheader()
-        for r in rows:
-            out_row: Dict[str, Any] = {}
-            for c in columns:
-                v = r.get(c, "")
-                if isinstance(v, float) and math.isnan(v):
-                    out_row[c] = "nan"
-                else:
-                    out_row[c] = v
-            w.writerow(out_row)
+    return tasks
 
 
-def aggregate_runs(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    groups: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = defaultdict(list)
-
-    for r in rows:
-        key = (
-            r.get("scenario"),
-            safe_int(r.get("h3_res"), default=0),
-            safe_float(r.get("zipf_s")),
-            safe_int(r.get("target_rps"), default=0),
-            str(r.get("ttl") or ""),
-            str(r.get("hot") or ""),
-            str(r.get("invalidation") or ""),
-        )
-        groups[key].append(r)
+def collect_runs(roots: List[Path]) -> Iterator[Dict[str, Any]]:
+    tasks = collect_rep_tasks(roots)
+    if not tasks:
+        return
 
-    agg_rows: List[Dict[str, Any]] = []
+    # Each rep is an independent JSON load + docker_stats.csv scan, so the
+    # work parallelizes cleanly across processes; map preserves task order.
+    with ProcessPoolExecutor() as ex:
+        for row in ex.map(_process_rep, tasks, chunksize=32):
+            if row is not None:
+                yield row
 
-    for key, rs in sorted(groups.items(), key=lambda kv: kv[0]):
-        scenario, h3_res, zipf_s, target_rps, ttl, hot, invalidation = key
 
-        agg: Dict[str, Any] = {}
-        agg["scenario"] = scenario
-        agg["h3_res"] = h3_res
-        agg["zipf_s"] = zipf_s
-        agg["target_rps"] = target_rps
-        agg["ttl"] = ttl
-        agg["hot"] = hot
-        agg["invalidation"] = invalidation
+def _csv_cell(v: Any) -> str:
+    if v is None:
+        return ""  # match csv.writer, which emits None as an empty field
+    if isinstance(v, float) and math.isnan(v):
+        return "nan"
+    s = str(v)
+    # Same quoting rule as csv.writer's QUOTE_MINIMAL; most cells here are
+    # clean numerics, so the quoted branch is rare.
+    if '"' in s or "," in s or "\n" in s or "\r" in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
 
-        agg["p50_ms_median"] = median_ignore_nan(r.get("p50_ms") for r in rs)
-        agg["p95_ms_median"] = median_ignore_nan(r.get("p95_ms") for r in rs)
-        agg["p99_ms_median"] = median_ignore_nan(r.get("p99_ms") for r in rs)
-        agg["throughput_rps_median"] = median_ignore_nan(r.get("throughput_rps") for r in rs)
 
-        agg["errors_sum"] = sum(safe_int(r.get("errors"), default=0) for r in rs)
+def write_csv(path: Path, columns: List[str], rows: Iterable[Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", buffering=1024 * 1024, encoding="utf-8") as f:
+        # Join lines manually and flush in chunks instead of paying
+        # DictWriter's per-row fieldname resolution and write call.
+        buf: List[str] = [",".join(columns) + "\r\n"]
+        for r in rows:
+            buf.append(",".join(_csv_cell(r.get(c, "")) for c in columns) + "\r\n")
+            if len(buf) >= 4096:
+                f.write("".join(buf))
+                buf.clear()
+        if buf:
+            f.write("".join(buf))
+
+
+_AGG_KEY_COLS: List[str] = [
+    "scenario", "h3_res", "zipf_s", "target_rps", "ttl", "hot", "invalidation",
+]
+
+_AGG_MEDIAN_COLS: Dict[str, str] = {
+    "p50_ms": "p50_ms_median",
+    "p95_ms": "p95_ms_median",
+    "p99_ms": "p99_ms_median",
+    "throughput_rps": "throughput_rps_median",
+    "postgis_cpu_avg_pct": "postgis_cpu_avg_pct_median",
+    "geoserver_cpu_avg_pct": "geoserver_cpu_avg_pct_median",
+    "postgis_mem_avg_mib": "postgis_mem_avg_mib_median",
+    "geoserver_mem_avg_mib": "geoserver_mem_avg_mib_median",
+}
 
-        agg["postgis_cpu_avg_pct_median"] = median_ignore_nan(r.get("postgis_cpu_avg_pct") for r in rs)
-        agg["geoserver_cpu_avg_pct_median"] = median_ignore_nan(r.get("geoserver_cpu_avg_pct") for r in rs)
-        agg["postgis_mem_avg_mib_median"] = median_ignore_nan(r.get("postgis_mem_avg_mib") for r in rs)
-        agg["geoserver_mem_avg_mib_median"] = median_ignore_nan(r.get("geoserver_mem_avg_mib") for r in rs)
+_AGG_INPUT_COLS: List[str] = _AGG_KEY_COLS + list(_AGG_MEDIAN_COLS) + ["errors"]
 
-        agg["n_reps"] = len(rs)
-        agg_rows.append(agg)
 
-    return agg_rows
+def aggregate_runs(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if not rows:
+        return []
+
+    df = pd.DataFrame(rows)
+    for c in list(_AGG_KEY_COLS) + list(_AGG_MEDIAN_COLS) + ["errors"]:
+        if c not in df.columns:
+            df[c] = None
+
+    # Normalize key columns the way safe_int/safe_float did per row.
+    df["h3_res"] = pd.to_numeric(df["h3_res"], errors="coerce").fillna(0).astype(int)
+    df["target_rps"] = pd.to_numeric(df["target_rps"], errors="coerce").fillna(0).astype(int)
+    df["zipf_s"] = pd.to_numeric(df["zipf_s"], errors="coerce")
+    for c in ("scenario", "ttl", "hot", "invalidation"):
+        df[c] = df[c].fillna("").astype(str)
+
+    # Metric columns: coerce so the C-level median skips NaN for free.
+    for c in _AGG_MEDIAN_COLS:
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+    df["errors"] = pd.to_numeric(df["errors"], errors="coerce").fillna(0).astype(int)
+
+    grouped = (
+        df.groupby(_AGG_KEY_COLS, dropna=False)
+        .agg(
+            **{out: (src, "median") for src, out in _AGG_MEDIAN_COLS.items()},
+            errors_sum=("errors", "sum"),
+            n_reps=("errors", "size"),
+        )
+        .reset_index()
+    )
+    return grouped.to_dict("records")
 
 
 def main() -> int:
@@ -510,13 +645,21 @@ def main() -> int:
     roots = [Path(r) for r in args.roots]
     outdir = Path(args.outdir)
 
-    runs_long = collect_runs(roots)
-    if not runs_long:
-        warn("No runs collected. Check your --roots paths.")
+    # Stream rows straight to runs_long.csv, keeping only the columns that
+    # aggregate_runs needs instead of every full row.
+    agg_input: List[Dict[str, Any]] = []
+
+    def tee_agg_input(rows: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for row in rows:
+            agg_input.append({k: row[k] for k in _AGG_INPUT_COLS if k in row})
+            yield row
+
     long_path = outdir / "runs_long.csv"
-    write_csv(long_path, RUNS_LONG_COLUMNS, runs_long)
+    write_csv(long_path, RUNS_LONG_COLUMNS, tee_agg_input(collect_runs(roots)))
+    if not agg_input:
+        warn("No runs collected. Check your --roots paths.")
 
-    runs_agg = aggregate_runs(runs_long)
+    runs_agg = aggregate_runs(agg_input)
     agg_path = outdir / "runs_agg.csv"
     write_csv(agg_path, RUNS_AGG_COLUMNS, runs_agg)
 
@@ -22,16 +22,30 @@ python3 scripts/make_plots.py
 from __future__ import annotations
 
 import argparse
-import math
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
 import matplotlib
 
 matplotlib.use("Agg")
+import matplotlib.font_manager  # noqa: E402,F401  (warm the font cache once, at import)
 import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 
+plt.rcParams["figure.autolayout"] = False
+plt.rcParams["path.simplify_threshold"] = 1.0
+
+try:  # C++ CSV writer when available; plain pandas otherwise
+    import pyarrow as pa  # noqa: E402
+    import pyarrow.csv as pacsv  # noqa: E402
+except ImportError:
+    pa = None
+    pacsv = None
+
 
 def warn(msg: str) -> None:
     print(f"[WARN] {msg}")
@@ -45,30 +59,64 @@ def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-def coerce_numeric(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
+def write_table_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write a table CSV through pyarrow's writer when it is installed."""
+    if pa is not None:
+        pacsv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            path,
+            write_options=pacsv.WriteOptions(quoting_style="needed"),
+        )
+    else:
+        df.to_csv(path, index=False)
+
+
+def coerce_numeric(df: pd.DataFrame, cols: Iterable[str], downcast: Optional[str] = None) -> pd.DataFrame:
     for c in cols:
         if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors="coerce")
+            df[c] = pd.to_numeric(df[c], errors="coerce", downcast=downcast)
     return df
 
 
-def save_fig(fig: plt.Figure, outpath: Path) -> None:
+# Render settings for save_fig; main() drops these for --draft runs.
+_SAVE_DPI = 220
+_SAVE_TIGHT = True
+
+
+def save_fig(fig: plt.Figure, outpath: Path, *, dpi: Optional[int] = None, tight: Optional[bool] = None) -> None:
+    # Does not close the figure: the caller reuses one Figure/Axes pair for
+    # every plot and clears it via reset_ax between figures.
     ensure_dir(outpath.parent)
-    try:
-        fig.tight_layout()
-    except Exception:
-        pass
-    fig.savefig(outpath, dpi=220, bbox_inches="tight")
-    plt.close(fig)
+    dpi = _SAVE_DPI if dpi is None else dpi
+    tight = _SAVE_TIGHT if tight is None else tight
+    if tight:
+        try:
+            fig.tight_layout()
+        except Exception:
+            pass
+    fig.savefig(outpath, dpi=dpi, bbox_inches="tight" if tight else None)
     wrote(outpath)
 
 
+def reset_ax(ax: plt.Axes) -> None:
+    ax.clear()
+    # tight_layout leaves its subplot params on the figure; restore the rc
+    # defaults so every plot starts from the same state as a fresh figure.
+    ax.figure.subplots_adjust(
+        left=plt.rcParams["figure.subplot.left"],
+        right=plt.rcParams["figure.subplot.right"],
+        bottom=plt.rcParams["figure.subplot.bottom"],
+        top=plt.rcParams["figure.subplot.top"],
+    )
+
+
 def sort_by_zipf(df: pd.DataFrame) -> pd.DataFrame:
     if "zipf_s" in df.columns:
         return df.sort_values(["zipf_s"])
     return df
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_label(scenario: str, h3_res: int) -> str:
     if scenario == "baseline" and h3_res == 0:
         return "baseline"
@@ -77,90 +125,130 @@ def get_config_label(scenario: str, h3_res: int) -> str:
     return f"{scenario} r{int(h3_res)}"
 
 
-def filter_config(df: pd.DataFrame, scenario: str, h3_res: int) -> pd.DataFrame:
-    return df[(df["scenario"] == scenario) & (df["h3_res"] == h3_res)].copy()
+ConfigMap = Dict[Tuple[str, int], pd.DataFrame]
 
 
-def line_configs_for_800() -> List[Tuple[str, int]]:
-    return [
-        ("baseline", 0),
-        ("cache", 7),
-        ("cache", 8),
-        ("cache", 9),
-    ]
+def group_by_config(df: pd.DataFrame) -> ConfigMap:
+    """Split a frame into per-(scenario, h3_res) sub-frames, once.
+
+    Uses groupby ``.indices`` + ``take`` so the hashing happens a single
+    time instead of two boolean masks per config per plot.
+    """
+    if df.empty:
+        return {}
+    idx_map = df.groupby(["scenario", "h3_res"], sort=False, observed=True).indices
+    return {cfg: df.take(idx) for cfg, idx in idx_map.items()}
+
+
+def xy_arrays(df: pd.DataFrame, xcol: str, ycol: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted-by-x, NaN-masked plain arrays for a plot call.
+
+    Passing ndarrays keeps matplotlib from unwrapping Series per call, and
+    the isnan mask replaces a dropna that would allocate a new frame.
+    """
+    sub = df.sort_values(xcol)
+    x = sub[xcol].to_numpy(dtype=float)
+    y = sub[ycol].to_numpy(dtype=float)
+    keep = ~(np.isnan(x) | np.isnan(y))
+    return x[keep], y[keep]
+
+
+# The four config lines every 800-RPS plot draws, with their labels
+# resolved once at import instead of per inner-loop iteration.
+_LINE_CONFIGS_800: Tuple[Tuple[str, int], ...] = (
+    ("baseline", 0),
+    ("cache", 7),
+    ("cache", 8),
+    ("cache", 9),
+)
+_CONFIG_LABELS = {cfg: get_config_label(*cfg) for cfg in _LINE_CONFIGS_800}
 
 
 def median_missed_tokens_from_long(df_long_800: pd.DataFrame) -> pd.DataFrame:
-    needed = ["scenario", "h3_res", "zipf_s", "target_rps", "missed_tokens"]
+    """Per-(scenario, h3_res, zipf_s, target_rps) median of missed_tokens.
+
+    Avoids the pandas groupby-median kernel: factorize the 4-key group to
+    an int id, sort values once with lexsort, then pick each group's
+    middle elements vectorized (NaNs sort last and are excluded from the
+    per-group count, matching groupby.median's skipna behaviour).
+    """
+    keys = ["scenario", "h3_res", "zipf_s", "target_rps"]
+    needed = [*keys, "missed_tokens"]
     for c in needed:
         if c not in df_long_800.columns:
             return pd.DataFrame(columns=needed)
-    g = (
-        df_long_800
-        .groupby(["scenario", "h3_res", "zipf_s", "target_rps"], dropna=False)["missed_tokens"]
-        .median()
-        .reset_index()
-        .rename(columns={"missed_tokens": "missed_tokens_median"})
-    )
-    return g
+    out_cols = [*keys, "missed_tokens_median"]
+    if df_long_800.empty:
+        return pd.DataFrame(columns=out_cols)
+
+    gb = df_long_800.groupby(keys, dropna=False, observed=True)
+    gid = gb.ngroup().to_numpy()
+    vals = pd.to_numeric(df_long_800["missed_tokens"], errors="coerce").to_numpy(dtype=float)
+
+    order = np.lexsort((vals, gid))
+    gid_s = gid[order]
+    vals_s = vals[order]
+    starts = np.flatnonzero(np.r_[True, gid_s[1:] != gid_s[:-1]])
+    counts = np.diff(np.r_[starts, gid_s.size])
+    nan_counts = np.bincount(gid_s[np.isnan(vals_s)], minlength=starts.size)
+    n = counts - nan_counts
+
+    lo = starts + np.maximum(n - 1, 0) // 2
+    hi = starts + np.maximum(n, 1) // 2
+    medians = np.where(n > 0, (vals_s[lo] + vals_s[hi]) / 2.0, np.nan)
+
+    out = gb.size().index.to_frame(index=False)
+    out["missed_tokens_median"] = medians
+    return out
+
+
+_LATEX_TRANS = str.maketrans({
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+})
 
 
 def latex_escape(s: str) -> str:
     if s is None:
         return ""
-    s = str(s)
-    rep = {
-        "\\": r"\textbackslash{}",
-        "&": r"\&",
-        "%": r"\%",
-        "$": r"\$",
-        "#": r"\#",
-        "_": r"\_",
-        "{": r"\{",
-        "}": r"\}",
-        "~": r"\textasciitilde{}",
-        "^": r"\textasciicircum{}",
-    }
-    for k, v in rep.items():
-        s = s.replace(k, v)
-    return s
+    return str(s).translate(_LATEX_TRANS)
 
 
-def is_nan(x) -> bool:
-    try:
-        return x is None or (isinstance(x, float) and math.isnan(x))
-    except Exception:
-        return False
+def _format_int_col(s: pd.Series) -> List[str]:
+    num = pd.to_numeric(s, errors="coerce")
+    mask = num.isna().to_numpy()
+    out = num.round().astype("Int64").astype(str).to_numpy(dtype=object)
+    out[mask] = "--"
+    return list(out)
 
 
-def format_cell(val, col: str) -> str:
-    if is_nan(val):
-        return "--"
-    if col in {"h3_res", "target_rps", "n_reps", "errors_sum"}:
-        try:
-            return str(int(round(float(val))))
-        except Exception:
-            return latex_escape(str(val))
+def _format_float_col(s: pd.Series, spec: str) -> List[str]:
+    num = pd.to_numeric(s, errors="coerce")
+    mask = num.isna().to_numpy()
+    vals = num.to_numpy(dtype=float, na_value=0.0)
+    out = np.char.mod(spec, vals).astype(object)
+    out[mask] = "--"
+    return list(out)
+
+
+_INT_COLS = frozenset(("h3_res", "target_rps", "n_reps", "errors_sum"))
+
+
+def numeric_column_formatter(col: str):
+    """Pick a whole-column formatter by column name, once per column."""
+    if col in _INT_COLS or col.startswith("best_h3_res_"):
+        return _format_int_col
     if col == "zipf_s":
-        try:
-            return f"{float(val):.1f}"
-        except Exception:
-            return latex_escape(str(val))
-    if col.startswith("best_h3_res_"):
-        try:
-            return str(int(round(float(val))))
-        except Exception:
-            return "--"
-    if col.startswith("best_") and col.endswith("_ms"):
-        try:
-            return f"{float(val):.3f}"
-        except Exception:
-            return "--"
-    try:
-        f = float(val)
-        return f"{f:.3f}"
-    except Exception:
-        return latex_escape(str(val))
+        return lambda s: _format_float_col(s, "%.1f")
+    return lambda s: _format_float_col(s, "%.3f")
 
 
 def write_minimal_latex_table(df: pd.DataFrame, outpath: Path, columns: List[str]) -> None:
@@ -179,21 +267,78 @@ def write_minimal_latex_table(df: pd.DataFrame, outpath: Path, columns: List[str
     aligns = ["r" if c in numeric_like else "l" for c in columns]
     colspec = "".join(aligns)
 
-    lines: List[str] = []
-    lines.append(r"\begin{tabular}{" + colspec + r"}")
-    lines.append(r"\hline")
-    header = " & ".join(latex_escape(c) for c in columns) + r" \\"
-    lines.append(header)
-    lines.append(r"\hline")
+    # Format column-by-column: pick a formatter per column name once and
+    # let it produce the whole string column in a vectorized pass.
+    formatted: List[List[str]] = []
+    for c in columns:
+        col = df[c] if c in df.columns else pd.Series([None] * len(df), index=df.index)
+        if c in numeric_like:
+            formatted.append(numeric_column_formatter(c)(col))
+        else:
+            formatted.append([latex_escape(v) for v in col])
+
+    header = " & ".join(latex_escape(c) for c in columns)
+    # Stream rows through a buffered handle instead of materializing the
+    # whole table as one string first.
+    with outpath.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("\\begin{tabular}{" + colspec + "}\n\\hline\n" + header + " \\\\\n\\hline\n")
+        f.writelines(" & ".join(cells) + " \\\\\n" for cells in zip(*formatted))
+        f.write("\\hline\n\\end{tabular}\n")
+    wrote(outpath)
 
-    for _, row in df.iterrows():
-        cells = [format_cell(row.get(c), c) if c in numeric_like else latex_escape(row.get(c)) for c in columns]
-        lines.append(" & ".join(cells) + r" \\")
-    lines.append(r"\hline")
-    lines.append(r"\end{tabular}")
 
-    outpath.write_text("\n".join(lines) + "\n", encoding="utf-8")
-    wrote(outpath)
+LONG_NUMERIC: List[str] = [
+    "rep", "h3_res", "zipf_s_from_folder", "duration_sec", "total", "success", "errors",
+    "throughput_rps", "target_rps", "achieved_to_target_ratio", "missed_tokens",
+    "max_backlog", "token_buffer",
+    "p50_ms", "p95_ms", "p99_ms", "concurrency", "zipf_s", "zipf_v", "bboxes", "seed",
+    "postgis_cpu_avg_pct", "geoserver_cpu_avg_pct", "postgis_mem_avg_mib", "geoserver_mem_avg_mib",
+]
+
+AGG_NUMERIC: List[str] = [
+    "h3_res", "zipf_s", "target_rps",
+    "p50_ms_median", "p95_ms_median", "p99_ms_median",
+    "throughput_rps_median", "errors_sum",
+    "postgis_cpu_avg_pct_median", "geoserver_cpu_avg_pct_median",
+    "postgis_mem_avg_mib_median", "geoserver_mem_avg_mib_median",
+    "n_reps",
+]
+
+# Everything the plots/tables actually read; the rest of runs_long.csv
+# (bundle names, timestamps, ...) is never materialized.
+_LONG_USECOLS = frozenset(["scenario", *LONG_NUMERIC])
+_AGG_USECOLS = frozenset(["scenario", *AGG_NUMERIC])
+
+
+# Count columns stay on the inferred to_numeric path so they keep their
+# integer dtype (and integer CSV formatting) when the data has no gaps.
+_AGG_COUNT_COLS = ["errors_sum", "n_reps"]
+
+
+def _read_csv(path: Path, wanted: frozenset, numeric: List[str], count_cols: List[str]) -> pd.DataFrame:
+    # A Parquet sidecar caches the parsed, typed frame: re-runs while
+    # iterating on plots skip the text parse entirely. Needs pyarrow and a
+    # sidecar at least as new as the CSV; otherwise parse and (re)write it.
+    sidecar = path.with_suffix(".parquet")
+    if pa is not None and sidecar.exists() and sidecar.stat().st_mtime >= path.stat().st_mtime:
+        return pd.read_parquet(sidecar, engine="pyarrow")
+
+    # Callable usecols tolerates columns missing from older files; typed-on-
+    # read dtypes make the parse single-pass and skip most of the coercion.
+    dtype = {"scenario": "category", **{c: "float64" for c in numeric if c not in count_cols}}
+    df = pd.read_csv(path, usecols=lambda c: c in wanted, dtype=dtype)
+    df = coerce_numeric(df, count_cols)
+
+    if pa is not None:
+        try:
+            # Write-then-rename so concurrent plot workers never read a
+            # half-written cache; the cache itself is best-effort.
+            tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+            df.to_parquet(tmp, engine="pyarrow", compression="zstd")
+            os.replace(tmp, sidecar)
+        except Exception:
+            pass
+    return df
 
 
 def load_csvs(indir: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -205,38 +350,28 @@ def load_csvs(indir: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
     if not agg_path.exists():
         raise FileNotFoundError(f"Missing {agg_path}")
 
-    df_long = pd.read_csv(long_path)
-    df_agg = pd.read_csv(agg_path)
+    df_long = _read_csv(long_path, _LONG_USECOLS, LONG_NUMERIC, [])
+    df_agg = _read_csv(agg_path, _AGG_USECOLS, AGG_NUMERIC, _AGG_COUNT_COLS)
 
-    long_numeric = [
-        "rep", "h3_res", "zipf_s_from_folder", "duration_sec", "total", "success", "errors",
-        "throughput_rps", "target_rps", "achieved_to_target_ratio", "missed_tokens",
-        "max_backlog", "token_buffer",
-        "p50_ms", "p95_ms", "p99_ms", "concurrency", "zipf_s", "zipf_v", "bboxes", "seed",
-        "postgis_cpu_avg_pct", "geoserver_cpu_avg_pct", "postgis_mem_avg_mib", "geoserver_mem_avg_mib",
-    ]
-    df_long = coerce_numeric(df_long, long_numeric)
-
-    agg_numeric = [
-        "h3_res", "zipf_s", "target_rps",
-        "p50_ms_median", "p95_ms_median", "p99_ms_median",
-        "throughput_rps_median", "errors_sum",
-        "postgis_cpu_avg_pct_median", "geoserver_cpu_avg_pct_median",
-        "postgis_mem_avg_mib_median", "geoserver_mem_avg_mib_median",
-        "n_reps",
-    ]
-    df_agg = coerce_numeric(df_agg, agg_numeric)
+    df_long = coerce_numeric(df_long, ["h3_res", "target_rps"], downcast="integer")
+    df_agg = coerce_numeric(df_agg, ["h3_res", "target_rps"], downcast="integer")
 
     return df_long, df_agg
 
 
-def plot_latency_vs_zipf(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Path) -> None:
-    dfA = df_agg[df_agg["target_rps"] == 800].copy()
-    if dfA.empty:
+def plot_latency_vs_zipf(
+    agg_800: pd.DataFrame,
+    long_800: pd.DataFrame,
+    agg_800_by_cfg: ConfigMap,
+    outdir: Path,
+    fig: plt.Figure,
+    ax: plt.Axes,
+) -> None:
+    if agg_800.empty:
         warn("A) No rows for target_rps==800 in runs_agg.csv; skipping A plots.")
         return
 
-    dfL = df_long[df_long["target_rps"] == 800].copy()
+    long_800_by_cfg = group_by_config(long_800)
 
     specs = [
         ("p50_ms_median", "P50 latency (ms)", "fig_latency_p50_vs_zipf_800.png"),
@@ -244,30 +379,49 @@ def plot_latency_vs_zipf(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Pa
         ("p99_ms_median", "P99 latency (ms)", "fig_latency_p99_vs_zipf_800.png"),
     ]
 
+    metrics = [s[0] for s in specs]
+    rep_cols = [m.removesuffix("_median") for m in metrics]  # p50_ms, etc.
+
+    # One data pass over the configs: sort by zipf once and pull every
+    # metric column out as arrays, instead of repeating the sub-frame
+    # extraction for each of the three figures.
+    lines = []
+    for scenario, h3_res in _LINE_CONFIGS_800:
+        sub = agg_800_by_cfg.get((scenario, h3_res))
+        if sub is None:
+            continue
+        sub = sub.sort_values("zipf_s")
+        x = sub["zipf_s"].to_numpy(dtype=float)
+        ys = {m: sub[m].to_numpy(dtype=float) for m in metrics}
+        subL = long_800_by_cfg.get((scenario, h3_res))
+        if subL is not None:
+            xL = subL["zipf_s"].to_numpy(dtype=float)
+            yLs = {r: subL[r].to_numpy(dtype=float) for r in rep_cols}
+        else:
+            xL, yLs = None, {}
+        lines.append((_CONFIG_LABELS[(scenario, h3_res)], x, ys, xL, yLs))
+
     for ycol, ylabel, fname in specs:
-        fig, ax = plt.subplots()
+        rep_y = ycol.removesuffix("_median")
+        reset_ax(ax)
         any_line = False
 
-        for scenario, h3_res in line_configs_for_800():
-            sub = filter_config(dfA, scenario, h3_res)
-            sub = sub.dropna(subset=["zipf_s", ycol])
-            if sub.empty:
+        for label, x, ys, xL, yLs in lines:
+            y = ys[ycol]
+            keep = ~(np.isnan(x) | np.isnan(y))
+            if not keep.any():
                 continue
-            sub = sub.sort_values("zipf_s")
-            ax.plot(sub["zipf_s"], sub[ycol], marker="o", label=get_config_label(scenario, h3_res))
+            ax.plot(x[keep], y[keep], marker="o", label=label)
             any_line = True
 
-            if not dfL.empty:
-                rep_y = ycol.replace("_median", "").replace("p", "p")  # p50_ms, etc.
-                rep_y = rep_y.replace("p50_ms", "p50_ms").replace("p95_ms", "p95_ms").replace("p99_ms", "p99_ms")
-                subL = dfL[(dfL["scenario"] == scenario) & (dfL["h3_res"] == h3_res)]
-                subL = subL.dropna(subset=["zipf_s", rep_y])
-                if not subL.empty:
-                    ax.scatter(subL["zipf_s"], subL[rep_y], s=18, alpha=0.45)
+            if xL is not None:
+                yL = yLs[rep_y]
+                keepL = ~(np.isnan(xL) | np.isnan(yL))
+                if keepL.any():
+                    ax.scatter(xL[keepL], yL[keepL], s=18, alpha=0.45)
 
         if not any_line:
             warn(f"A) No data for {fname}; skipping.")
-            plt.close(fig)
             continue
 
         ax.set_xlabel("Zipf skew (s)")
@@ -277,14 +431,14 @@ def plot_latency_vs_zipf(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Pa
         save_fig(fig, outdir / fname)
 
 
-def plot_latency_vs_h3res(df_agg: pd.DataFrame, outdir: Path) -> None:
-    dfB = df_agg[(df_agg["target_rps"] == 800) & (df_agg["scenario"].isin(["baseline", "cache"]))].copy()
+def plot_latency_vs_h3res(df_agg: pd.DataFrame, outdir: Path, fig: plt.Figure, ax: plt.Axes) -> None:
+    dfB = df_agg.query("target_rps == 800 and scenario in ('baseline', 'cache')")
     if dfB.empty:
         warn("B) No rows for target_rps==800 in runs_agg.csv; skipping B plots.")
         return
 
-    dfB = dfB[((dfB["scenario"] == "baseline") & (dfB["h3_res"] == 0)) |
-              ((dfB["scenario"] == "cache") & (dfB["h3_res"].isin([7, 8, 9])))]
+    dfB = dfB.query("(scenario == 'baseline' and h3_res == 0) or "
+                    "(scenario == 'cache' and h3_res in (7, 8, 9))")
     if dfB.empty:
         warn("B) After filtering to baseline r0 + cache r7/8/9, no rows; skipping.")
         return
@@ -301,40 +455,44 @@ def plot_latency_vs_h3res(df_agg: pd.DataFrame, outdir: Path) -> None:
         return
 
     x_order = [0, 7, 8, 9]
+    idx_map = dfB.groupby(["zipf_s", "scenario", "h3_res"], sort=False, observed=True).indices
+    metrics = [s[0] for s in specs]
+    metric_vals = {m: dfB[m].to_numpy() for m in metrics}
+
+    # One pass over (zipf, resolution): resolve each config row once and
+    # collect the points for all three metrics together.
+    series: Dict[str, List[Tuple[float, List[int], List[float]]]] = {m: [] for m in metrics}
+    for z in zipfs:
+        pts = {m: ([], []) for m in metrics}
+        for x in x_order:
+            scenario = "baseline" if x == 0 else "cache"
+            idx = idx_map.get((z, scenario, x))
+            if idx is None:
+                continue
+            i = idx[0]
+            for m in metrics:
+                yv = metric_vals[m][i]
+                if not pd.isna(yv):
+                    pts[m][0].append(x)
+                    pts[m][1].append(yv)
+        for m in metrics:
+            if pts[m][0]:
+                series[m].append((z, *pts[m]))
 
     for ycol, ylabel, fname in specs:
-        fig, ax = plt.subplots()
+        reset_ax(ax)
         any_line = False
 
-        for z in zipfs:
-            zdf = dfB[dfB["zipf_s"] == z].copy()
-            if zdf.empty:
-                continue
-
-            xs, ys = [], []
-            for x in x_order:
-                if x == 0:
-                    row = zdf[(zdf["scenario"] == "baseline") & (zdf["h3_res"] == 0)]
-                else:
-                    row = zdf[(zdf["scenario"] == "cache") & (zdf["h3_res"] == x)]
-                if row.empty:
-                    continue
-                yv = row[ycol].iloc[0]
-                if pd.isna(yv):
-                    continue
-                xs.append(x)
-                ys.append(yv)
-
+        for z, xs, ys in series[ycol]:
             if len(xs) >= 2:
                 ax.plot(xs, ys, marker="o", label=f"zipf_s={z:.1f}")
                 any_line = True
-            elif len(xs) == 1:
+            else:
                 ax.scatter(xs, ys, label=f"zipf_s={z:.1f}")
                 any_line = True
 
         if not any_line:
             warn(f"B) No data for {fname}; skipping.")
-            plt.close(fig)
             continue
 
         ax.set_xlabel("H3 resolution (0=baseline)")
@@ -345,22 +503,32 @@ def plot_latency_vs_h3res(df_agg: pd.DataFrame, outdir: Path) -> None:
         save_fig(fig, outdir / fname)
 
 
-def plot_throughput_and_errors(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Path) -> None:
-    dfC = df_agg[df_agg["target_rps"] == 800].copy()
-    if dfC.empty:
+def plot_throughput_and_errors(
+    agg_800: pd.DataFrame,
+    long_800: pd.DataFrame,
+    agg_800_by_cfg: ConfigMap,
+    outdir: Path,
+    fig: plt.Figure,
+    ax: plt.Axes,
+) -> None:
+    if agg_800.empty:
         warn("C) No rows for target_rps==800 in runs_agg.csv; skipping C plots.")
         return
 
-    dfC["achieved_ratio_calc"] = dfC["throughput_rps_median"] / dfC["target_rps"]
-
-    fig, ax = plt.subplots()
+    reset_ax(ax)
     any_line = False
-    for scenario, h3_res in line_configs_for_800():
-        sub = filter_config(dfC, scenario, h3_res).dropna(subset=["zipf_s", "achieved_ratio_calc"])
-        if sub.empty:
+    for scenario, h3_res in _LINE_CONFIGS_800:
+        sub = agg_800_by_cfg.get((scenario, h3_res))
+        if sub is None:
             continue
         sub = sub.sort_values("zipf_s")
-        ax.plot(sub["zipf_s"], sub["achieved_ratio_calc"], marker="o", label=get_config_label(scenario, h3_res))
+        x = sub["zipf_s"].to_numpy(dtype=float)
+        thr = sub["throughput_rps_median"].to_numpy(dtype=float)
+        tgt = sub["target_rps"].to_numpy(dtype=float)
+        keep = ~(np.isnan(x) | np.isnan(thr) | np.isnan(tgt))
+        if not keep.any():
+            continue
+        ax.plot(x[keep], thr[keep] / tgt[keep], marker="o", label=_CONFIG_LABELS[(scenario, h3_res)])
         any_line = True
     if any_line:
         ax.set_xlabel("Zipf skew (s)")
@@ -370,16 +538,17 @@ def plot_throughput_and_errors(df_agg: pd.DataFrame, df_long: pd.DataFrame, outd
         save_fig(fig, outdir / "fig_achieved_ratio_vs_zipf_800.png")
     else:
         warn("C7) No data for achieved ratio plot; skipping.")
-        plt.close(fig)
 
-    fig, ax = plt.subplots()
+    reset_ax(ax)
     any_line = False
-    for scenario, h3_res in line_configs_for_800():
-        sub = filter_config(dfC, scenario, h3_res).dropna(subset=["zipf_s", "errors_sum"])
-        if sub.empty:
+    for scenario, h3_res in _LINE_CONFIGS_800:
+        sub = agg_800_by_cfg.get((scenario, h3_res))
+        if sub is None:
             continue
-        sub = sub.sort_values("zipf_s")
-        ax.plot(sub["zipf_s"], sub["errors_sum"], marker="o", label=get_config_label(scenario, h3_res))
+        x, y = xy_arrays(sub, "zipf_s", "errors_sum")
+        if not x.size:
+            continue
+        ax.plot(x, y, marker="o", label=_CONFIG_LABELS[(scenario, h3_res)])
         any_line = True
     if any_line:
         ax.set_xlabel("Zipf skew (s)")
@@ -389,9 +558,8 @@ def plot_throughput_and_errors(df_agg: pd.DataFrame, df_long: pd.DataFrame, outd
         save_fig(fig, outdir / "fig_errors_vs_zipf_800.png")
     else:
         warn("C8) No data for errors plot; skipping.")
-        plt.close(fig)
 
-    dfL = df_long[df_long["target_rps"] == 800].copy()
+    dfL = long_800
     if dfL.empty or "missed_tokens" not in dfL.columns:
         warn("C9) runs_long has no target_rps==800 or missed_tokens; skipping missed_tokens plot.")
         return
@@ -401,14 +569,17 @@ def plot_throughput_and_errors(df_agg: pd.DataFrame, df_long: pd.DataFrame, outd
         warn("C9) Could not compute missed_tokens median; skipping.")
         return
 
-    fig, ax = plt.subplots()
+    reset_ax(ax)
     any_line = False
-    for scenario, h3_res in line_configs_for_800():
-        sub = mt[(mt["scenario"] == scenario) & (mt["h3_res"] == h3_res)].dropna(subset=["zipf_s", "missed_tokens_median"])
-        if sub.empty:
+    mt_by_cfg = group_by_config(mt)
+    for scenario, h3_res in _LINE_CONFIGS_800:
+        sub = mt_by_cfg.get((scenario, h3_res))
+        if sub is None:
             continue
-        sub = sub.sort_values("zipf_s")
-        ax.plot(sub["zipf_s"], sub["missed_tokens_median"], marker="o", label=get_config_label(scenario, h3_res))
+        x, y = xy_arrays(sub, "zipf_s", "missed_tokens_median")
+        if not x.size:
+            continue
+        ax.plot(x, y, marker="o", label=_CONFIG_LABELS[(scenario, h3_res)])
         any_line = True
 
     if any_line:
@@ -419,57 +590,59 @@ def plot_throughput_and_errors(df_agg: pd.DataFrame, df_long: pd.DataFrame, outd
         save_fig(fig, outdir / "fig_missed_tokens_vs_zipf_800.png")
     else:
         warn("C9) No data for missed_tokens plot; skipping.")
-        plt.close(fig)
 
 
-def plot_cache_context_proxies(df_agg: pd.DataFrame, outdir: Path) -> None:
-    dfD = df_agg[df_agg["target_rps"] == 800].copy()
-    if dfD.empty:
+def plot_cache_context_proxies(
+    agg_800: pd.DataFrame,
+    agg_800_by_cfg: ConfigMap,
+    outdir: Path,
+    fig: plt.Figure,
+    ax: plt.Axes,
+) -> None:
+    if agg_800.empty:
         warn("D) No rows for target_rps==800; skipping speedup plots.")
         return
 
-    base = dfD[(dfD["scenario"] == "baseline") & (dfD["h3_res"] == 0)].dropna(subset=["zipf_s"])
-    if base.empty:
-        warn("D) No baseline rows at 800 RPS; skipping speedup plots.")
-        return
-
-    base = base.set_index("zipf_s")
-
     specs = [
         ("p50_ms_median", "Speedup (baseline/cache) @ P50", "fig_speedup_p50_vs_zipf_800.png"),
         ("p95_ms_median", "Speedup (baseline/cache) @ P95", "fig_speedup_p95_vs_zipf_800.png"),
         ("p99_ms_median", "Speedup (baseline/cache) @ P99", "fig_speedup_p99_vs_zipf_800.png"),
     ]
+    metrics = [m for m, _, _ in specs]
+
+    # One pivot gives every (metric, scenario, h3_res) series indexed by
+    # zipf_s; speedups are then plain column divisions instead of a
+    # set_index+join round-trip per metric and resolution.
+    wide = agg_800.pivot_table(
+        index="zipf_s", columns=["scenario", "h3_res"], values=metrics, observed=True
+    )
+    if wide.empty or not any((m, "baseline", 0) in wide.columns for m in metrics):
+        warn("D) No baseline rows at 800 RPS; skipping speedup plots.")
+        return
 
     for metric, ylabel, fname in specs:
-        fig, ax = plt.subplots()
+        reset_ax(ax)
         any_line = False
 
-        for res in [7, 8, 9]:
-            cache = dfD[(dfD["scenario"] == "cache") & (dfD["h3_res"] == res)].dropna(subset=["zipf_s", metric])
-            if cache.empty:
-                continue
-            cache = cache.set_index("zipf_s")
-
-            joined = base[[metric]].join(cache[[metric]], lsuffix="_base", rsuffix="_cache", how="inner").dropna()
-            if joined.empty:
-                continue
-
-            denom = joined[f"{metric}_cache"].replace(0, pd.NA)
-            speed = (joined[f"{metric}_base"] / denom).astype(float)
-            speed = speed.dropna()
-
-            if speed.empty:
-                continue
+        base_col = wide.get((metric, "baseline", 0))
+        if base_col is not None:
+            base_vals = base_col.to_numpy(dtype=float)
+            zipf_x = wide.index.to_numpy(dtype=float)
+            for res in [7, 8, 9]:
+                col = wide.get((metric, "cache", res))
+                if col is None:
+                    continue
+                cache_vals = col.to_numpy(dtype=float)
+                speed = base_vals / np.where(cache_vals != 0, cache_vals, np.nan)
+                keep = ~np.isnan(speed)
+                if not keep.any():
+                    continue
 
-            xs = sorted(speed.index.tolist())
-            ys = [float(speed.loc[x]) for x in xs]
-            ax.plot(xs, ys, marker="o", label=f"cache r{res}")
-            any_line = True
+                ax.plot(zipf_x[keep], speed[keep], marker="o", label=f"cache r{res}")
+                any_line = True
 
         if not any_line:
             warn(f"D) No data for {fname}; skipping.")
-            plt.close(fig)
             continue
 
         ax.set_xlabel("Zipf skew (s)")
@@ -479,9 +652,14 @@ def plot_cache_context_proxies(df_agg: pd.DataFrame, outdir: Path) -> None:
         save_fig(fig, outdir / fname)
 
 
-def plot_backend_load(df_agg: pd.DataFrame, outdir: Path) -> None:
-    dfE = df_agg[df_agg["target_rps"] == 800].copy()
-    if dfE.empty:
+def plot_backend_load(
+    agg_800: pd.DataFrame,
+    agg_800_by_cfg: ConfigMap,
+    outdir: Path,
+    fig: plt.Figure,
+    ax: plt.Axes,
+) -> None:
+    if agg_800.empty:
         warn("E) No rows for target_rps==800; skipping backend plots.")
         return
 
@@ -493,20 +671,21 @@ def plot_backend_load(df_agg: pd.DataFrame, outdir: Path) -> None:
     ]
 
     for ycol, ylabel, fname in plot_specs:
-        fig, ax = plt.subplots()
+        reset_ax(ax)
         any_line = False
 
-        for scenario, h3_res in line_configs_for_800():
-            sub = filter_config(dfE, scenario, h3_res).dropna(subset=["zipf_s", ycol])
-            if sub.empty:
+        for scenario, h3_res in _LINE_CONFIGS_800:
+            sub = agg_800_by_cfg.get((scenario, h3_res))
+            if sub is None:
+                continue
+            x, y = xy_arrays(sub, "zipf_s", ycol)
+            if not x.size:
                 continue
-            sub = sub.sort_values("zipf_s")
-            ax.plot(sub["zipf_s"], sub[ycol], marker="o", label=get_config_label(scenario, h3_res))
+            ax.plot(x, y, marker="o", label=_CONFIG_LABELS[(scenario, h3_res)])
             any_line = True
 
         if not any_line:
             warn(f"E) No data for {fname}; skipping.")
-            plt.close(fig)
             continue
 
         ax.set_xlabel("Zipf skew (s)")
@@ -515,40 +694,34 @@ def plot_backend_load(df_agg: pd.DataFrame, outdir: Path) -> None:
         ax.legend()
         save_fig(fig, outdir / fname)
 
-    base = dfE[(dfE["scenario"] == "baseline") & (dfE["h3_res"] == 0)].dropna(subset=["zipf_s", "postgis_cpu_avg_pct_median"])
-    if base.empty:
+    # Same pivot-once pattern as the speedup plots: offload factors become
+    # column divisions on a single zipf_s-indexed wide frame.
+    wide = agg_800.pivot_table(
+        index="zipf_s", columns=["scenario", "h3_res"], values="postgis_cpu_avg_pct_median", observed=True
+    )
+    base_col = wide.get(("baseline", 0))
+    if base_col is None or base_col.dropna().empty:
         warn("E17) No baseline PostGIS CPU at 800 RPS; skipping offload factor plot.")
         return
 
-    base = base.set_index("zipf_s")
-
-    fig, ax = plt.subplots()
+    reset_ax(ax)
     any_line = False
+    base_vals = base_col.to_numpy(dtype=float)
+    zipf_x = wide.index.to_numpy(dtype=float)
     for res in [7, 8, 9]:
-        cache = dfE[(dfE["scenario"] == "cache") & (dfE["h3_res"] == res)].dropna(subset=["zipf_s", "postgis_cpu_avg_pct_median"])
-        if cache.empty:
-            continue
-        cache = cache.set_index("zipf_s")
-        joined = base[["postgis_cpu_avg_pct_median"]].join(
-            cache[["postgis_cpu_avg_pct_median"]],
-            lsuffix="_base",
-            rsuffix="_cache",
-            how="inner",
-        ).dropna()
-        if joined.empty:
+        col = wide.get(("cache", res))
+        if col is None:
             continue
-        denom = joined["postgis_cpu_avg_pct_median_cache"].replace(0, pd.NA)
-        off = (joined["postgis_cpu_avg_pct_median_base"] / denom).astype(float).dropna()
-        if off.empty:
+        cache_vals = col.to_numpy(dtype=float)
+        off = base_vals / np.where(cache_vals != 0, cache_vals, np.nan)
+        keep = ~np.isnan(off)
+        if not keep.any():
             continue
-        xs = sorted(off.index.tolist())
-        ys = [float(off.loc[x]) for x in xs]
-        ax.plot(xs, ys, marker="o", label=f"cache r{res}")
+        ax.plot(zipf_x[keep], off[keep], marker="o", label=f"cache r{res}")
         any_line = True
 
     if not any_line:
         warn("E17) No data for offload factor plot; skipping.")
-        plt.close(fig)
         return
 
     ax.set_xlabel("Zipf skew (s)")
@@ -558,14 +731,14 @@ def plot_backend_load(df_agg: pd.DataFrame, outdir: Path) -> None:
     save_fig(fig, outdir / "fig_backend_offload_factor_postgis_cpu_vs_zipf_800.png")
 
 
-def plot_load_sensitivity(df_agg: pd.DataFrame, outdir: Path) -> None:
-    dfF = df_agg[df_agg["zipf_s"] == 1.3].copy()
+def plot_load_sensitivity(df_agg: pd.DataFrame, outdir: Path, fig: plt.Figure, ax: plt.Axes) -> None:
+    dfF = df_agg.query("zipf_s == 1.3")
     if dfF.empty:
         warn("F) No rows for zipf_s==1.3 in runs_agg; skipping load sensitivity.")
         return
 
-    base = dfF[(dfF["scenario"] == "baseline") & (dfF["h3_res"] == 0)].copy()
-    cache = dfF[(dfF["scenario"] == "cache") & (dfF["h3_res"] == 8)].copy()
+    base = dfF.query("scenario == 'baseline' and h3_res == 0")
+    cache = dfF.query("scenario == 'cache' and h3_res == 8")
 
     wanted_rps = [600, 800, 1000]
     base = base[base["target_rps"].isin(wanted_rps)]
@@ -576,24 +749,19 @@ def plot_load_sensitivity(df_agg: pd.DataFrame, outdir: Path) -> None:
         return
 
     def plot_two_lines(ycol: str, ylabel: str, fname: str) -> None:
-        fig, ax = plt.subplots()
+        reset_ax(ax)
         any_line = False
 
-        if not base.empty:
-            s = base.dropna(subset=["target_rps", ycol]).sort_values("target_rps")
-            if not s.empty:
-                ax.plot(s["target_rps"], s[ycol], marker="o", label="baseline (r0)")
-                any_line = True
-
-        if not cache.empty:
-            s = cache.dropna(subset=["target_rps", ycol]).sort_values("target_rps")
-            if not s.empty:
-                ax.plot(s["target_rps"], s[ycol], marker="o", label="cache (r8)")
+        for frame, label in ((base, "baseline (r0)"), (cache, "cache (r8)")):
+            if frame.empty:
+                continue
+            x, y = xy_arrays(frame, "target_rps", ycol)
+            if x.size:
+                ax.plot(x, y, marker="o", label=label)
                 any_line = True
 
         if not any_line:
             warn(f"F) No data for {fname}; skipping.")
-            plt.close(fig)
             return
 
         ax.set_xlabel("Target load (RPS)")
@@ -609,24 +777,17 @@ def plot_load_sensitivity(df_agg: pd.DataFrame, outdir: Path) -> None:
 
     plot_two_lines("postgis_cpu_avg_pct_median", "PostGIS CPU (%)", "fig_loadsens_postgis_cpu_vs_rps_zipf1p3_r8.png")
 
-    base2 = base.copy()
-    cache2 = cache.copy()
-    if not base2.empty:
-        base2["achieved_ratio_calc"] = base2["throughput_rps_median"] / base2["target_rps"]
-    if not cache2.empty:
-        cache2["achieved_ratio_calc"] = cache2["throughput_rps_median"] / cache2["target_rps"]
-
-    fig, ax = plt.subplots()
+    reset_ax(ax)
     any_line = False
-    if not base2.empty:
-        s = base2.dropna(subset=["target_rps", "achieved_ratio_calc"]).sort_values("target_rps")
-        if not s.empty:
-            ax.plot(s["target_rps"], s["achieved_ratio_calc"], marker="o", label="baseline (r0)")
-            any_line = True
-    if not cache2.empty:
-        s = cache2.dropna(subset=["target_rps", "achieved_ratio_calc"]).sort_values("target_rps")
-        if not s.empty:
-            ax.plot(s["target_rps"], s["achieved_ratio_calc"], marker="o", label="cache (r8)")
+    for frame, label in ((base, "baseline (r0)"), (cache, "cache (r8)")):
+        if frame.empty:
+            continue
+        s = frame.sort_values("target_rps")
+        x = s["target_rps"].to_numpy(dtype=float)
+        ratio = s["throughput_rps_median"].to_numpy(dtype=float) / x
+        keep = ~(np.isnan(x) | np.isnan(ratio))
+        if keep.any():
+            ax.plot(x[keep], ratio[keep], marker="o", label=label)
             any_line = True
 
     if any_line:
@@ -638,7 +799,6 @@ def plot_load_sensitivity(df_agg: pd.DataFrame, outdir: Path) -> None:
         save_fig(fig, outdir / "fig_loadsens_achieved_ratio_vs_rps_zipf1p3_r8.png")
     else:
         warn("F22) No data for achieved ratio load-sensitivity plot; skipping.")
-        plt.close(fig)
 
 
 def write_tables(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Path) -> None:
@@ -652,13 +812,13 @@ def write_tables(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Path) -> N
         "postgis_mem_avg_mib_median", "geoserver_mem_avg_mib_median",
         "n_reps",
     ]
-    t1 = df_agg[df_agg["target_rps"] == 800].copy()
-    if t1.empty:
+    mask_800 = df_agg["target_rps"].to_numpy() == 800
+    if not mask_800.any():
         warn("Tables) No rows for target_rps==800; skipping table_800_summary.")
     else:
-        t1 = t1[cols_800].sort_values(["zipf_s", "scenario", "h3_res"])
+        t1 = df_agg.loc[mask_800, cols_800].sort_values(["zipf_s", "scenario", "h3_res"])
         t1_csv = outdir / "table_800_summary.csv"
-        t1.to_csv(t1_csv, index=False)
+        write_table_csv(t1, t1_csv)
         wrote(t1_csv)
 
         t1_tex = outdir / "table_800_summary.tex"
@@ -670,24 +830,21 @@ def write_tables(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Path) -> N
         "throughput_rps_median", "errors_sum",
         "postgis_cpu_avg_pct_median", "geoserver_cpu_avg_pct_median",
     ]
-    t2 = df_agg[(df_agg["zipf_s"] == 1.3) &
-                (((df_agg["scenario"] == "baseline") & (df_agg["h3_res"] == 0)) |
-                 ((df_agg["scenario"] == "cache") & (df_agg["h3_res"] == 8))) &
-                (df_agg["target_rps"].isin([600, 800, 1000]))].copy()
+    t2 = df_agg.query("zipf_s == 1.3 and target_rps in (600, 800, 1000) and "
+                      "((scenario == 'baseline' and h3_res == 0) or "
+                      "(scenario == 'cache' and h3_res == 8))")
     if t2.empty:
         warn("Tables) No rows for load sensitivity table; skipping table_load_sensitivity.")
     else:
         t2 = t2[cols_load].sort_values(["target_rps", "scenario", "h3_res"])
         t2_csv = outdir / "table_load_sensitivity.csv"
-        t2.to_csv(t2_csv, index=False)
+        write_table_csv(t2, t2_csv)
         wrote(t2_csv)
 
         t2_tex = outdir / "table_load_sensitivity.tex"
         write_minimal_latex_table(t2, t2_tex, cols_load)
 
-    t3src = df_agg[(df_agg["target_rps"] == 800) &
-                   (df_agg["scenario"] == "cache") &
-                   (df_agg["h3_res"].isin([7, 8, 9]))].copy()
+    t3src = df_agg.query("target_rps == 800 and scenario == 'cache' and h3_res in (7, 8, 9)")
     if t3src.empty:
         warn("Tables) No cache rows for best-config table; skipping table_best_config_by_zipf.")
         return
@@ -698,34 +855,22 @@ def write_tables(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Path) -> N
         warn("Tables) No cache configs sustain load (>=0.95*target); skipping table_best_config_by_zipf.")
         return
 
-    rows = []
-    for z in sorted(t3src["zipf_s"].unique()):
-        zdf = t3src[t3src["zipf_s"] == z].copy()
-        if zdf.empty:
-            continue
-
-        def best_for(metric: str) -> Tuple[Optional[int], float]:
-            cand = zdf.dropna(subset=[metric])
-            if cand.empty:
-                return None, float("nan")
-            i = cand[metric].idxmin()
-            return int(cand.loc[i, "h3_res"]), float(cand.loc[i, metric])
-
-        best_r_p50, best_p50 = best_for("p50_ms_median")
-        best_r_p95, best_p95 = best_for("p95_ms_median")
-        best_r_p99, best_p99 = best_for("p99_ms_median")
-
-        rows.append({
-            "zipf_s": float(z),
-            "best_h3_res_p50": best_r_p50 if best_r_p50 is not None else float("nan"),
-            "best_p50_ms": best_p50,
-            "best_h3_res_p95": best_r_p95 if best_r_p95 is not None else float("nan"),
-            "best_p95_ms": best_p95,
-            "best_h3_res_p99": best_r_p99 if best_r_p99 is not None else float("nan"),
-            "best_p99_ms": best_p99,
-        })
-
-    t3 = pd.DataFrame(rows)
+    zipfs = pd.Index(sorted(t3src["zipf_s"].unique()), name="zipf_s")
+    data: Dict[str, object] = {"zipf_s": zipfs.to_numpy(dtype=float)}
+    for metric, tag in (("p50_ms_median", "p50"), ("p95_ms_median", "p95"), ("p99_ms_median", "p99")):
+        # One vectorized idxmin over all zipf groups instead of a Python
+        # loop running idxmin + two .loc lookups per (zipf, metric) pair.
+        winners = t3src.dropna(subset=[metric]).groupby("zipf_s")[metric].idxmin().reindex(zipfs)
+        has = winners.notna().to_numpy()
+        picked = winners.to_numpy()[has]
+        best_res = pd.array([pd.NA] * len(zipfs), dtype="Int64")
+        best_val = np.full(len(zipfs), np.nan)
+        best_res[has] = t3src.loc[picked, "h3_res"].to_numpy(dtype="int64")
+        best_val[has] = t3src.loc[picked, metric].to_numpy(dtype=float)
+        data[f"best_h3_res_{tag}"] = best_res
+        data[f"best_{tag}_ms"] = best_val
+
+    t3 = pd.DataFrame(data)
     if t3.empty:
         warn("Tables) Best-config table ended up empty; skipping.")
         return
@@ -739,13 +884,63 @@ def write_tables(df_agg: pd.DataFrame, df_long: pd.DataFrame, outdir: Path) -> N
     t3 = t3[cols_best].sort_values(["zipf_s"])
 
     t3_csv = outdir / "table_best_config_by_zipf.csv"
-    t3.to_csv(t3_csv, index=False)
+    write_table_csv(t3, t3_csv)
     wrote(t3_csv)
 
     t3_tex = outdir / "table_best_config_by_zipf.tex"
     write_minimal_latex_table(t3, t3_tex, cols_best)
 
 
+# Independent output sections; each renders its own files from the same two
+# CSVs, so they parallelize across worker processes with no shared state.
+_SECTIONS = ("latency_zipf", "latency_h3res", "throughput", "proxies", "backend", "loadsens", "tables")
+
+SectionTask = Tuple[str, str, str, bool]
+
+
+def _run_section(task: SectionTask) -> None:
+    """Worker: re-read the CSVs and render one output section.
+
+    Takes paths rather than frames so the task pickles cheaply; the CSVs
+    are small next to the Agg rendering work each worker does.
+    """
+    section, indir_s, outdir_s, draft = task
+    if draft:
+        global _SAVE_DPI, _SAVE_TIGHT
+        _SAVE_DPI = 96
+        _SAVE_TIGHT = False
+
+    outdir = Path(outdir_s)
+    df_long, df_agg = load_csvs(Path(indir_s))
+
+    if section == "tables":
+        write_tables(df_agg, df_long, outdir)
+        return
+
+    # Slice the 800-RPS view and its per-config sub-frames once; the plot
+    # sections read from these instead of re-filtering the full frames.
+    # A plain numpy mask avoids materializing anything when no rows match.
+    agg_800 = df_agg.loc[df_agg["target_rps"].to_numpy() == 800]
+    long_800 = df_long.loc[df_long["target_rps"].to_numpy() == 800]
+    agg_800_by_cfg = group_by_config(agg_800)
+
+    # One Figure/Axes pair per worker; each plot clears it via reset_ax.
+    fig, ax = plt.subplots()
+    if section == "latency_zipf":
+        plot_latency_vs_zipf(agg_800, long_800, agg_800_by_cfg, outdir, fig, ax)
+    elif section == "latency_h3res":
+        plot_latency_vs_h3res(df_agg, outdir, fig, ax)
+    elif section == "throughput":
+        plot_throughput_and_errors(agg_800, long_800, agg_800_by_cfg, outdir, fig, ax)
+    elif section == "proxies":
+        plot_cache_context_proxies(agg_800, agg_800_by_cfg, outdir, fig, ax)
+    elif section == "backend":
+        plot_backend_load(agg_800, agg_800_by_cfg, outdir, fig, ax)
+    elif section == "loadsens":
+        plot_load_sensitivity(df_agg, outdir, fig, ax)
+    plt.close(fig)
+
+
 def main() -> int:
     script_dir = Path(__file__).resolve().parent
     default_dir = script_dir / "aggregated"
@@ -753,22 +948,18 @@ def main() -> int:
     ap = argparse.ArgumentParser(description="Generate thesis plots + tables from runs_long.csv and runs_agg.csv.")
     ap.add_argument("--indir", default=str(default_dir), help="Directory containing runs_long.csv and runs_agg.csv.")
     ap.add_argument("--outdir", default=str(default_dir), help="Directory to write plots and tables into.")
+    ap.add_argument("--draft", action="store_true",
+                    help="Faster renders for iteration: 96 dpi, no tight bounding box.")
     args = ap.parse_args()
 
     indir = Path(args.indir)
     outdir = Path(args.outdir)
     ensure_dir(outdir)
 
-    df_long, df_agg = load_csvs(indir)
-
-    plot_latency_vs_zipf(df_agg, df_long, outdir)
-    plot_latency_vs_h3res(df_agg, outdir)
-    plot_throughput_and_errors(df_agg, df_long, outdir)
-    plot_cache_context_proxies(df_agg, outdir)
-    plot_backend_load(df_agg, outdir)
-    plot_load_sensitivity(df_agg, outdir)
-
-    write_tables(df_agg, df_long, outdir)
+    tasks = [(section, str(indir), str(outdir), args.draft) for section in _SECTIONS]
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as ex:
+        # list() drains the iterator so worker exceptions surface here.
+        list(ex.map(_run_section, tasks))
 
     return 0
 